@@ -0,0 +1,75 @@
+"""Per-call overhead of building a boto3 client per call vs. the shared pool.
+
+Usage: python -m benchmarks.bench_client_pool [--calls N]
+
+Both variants call DescribeInstances against a local stub endpoint, so the
+numbers isolate client construction, endpoint resolution and connection
+setup from real AWS latency.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from typing import Callable, List
+
+import boto3
+
+from src.infrastructure.aws import AWSClientPool, AWSEC2Repository
+from .stub_ec2 import StubEC2Server
+
+REGION = "us-east-1"
+
+
+def _measure(calls: int, fn: Callable[[], object]) -> List[float]:
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _report(label: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<28} mean={statistics.mean(samples):7.3f} ms  "
+        f"p50={statistics.median(samples):7.3f} ms  p95={p95:7.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+    with StubEC2Server() as server:
+
+        def client_per_call() -> object:
+            client = boto3.client(
+                "ec2", region_name=REGION, endpoint_url=server.endpoint_url
+            )
+            return client.describe_instances()
+
+        pool = AWSClientPool(endpoint_url=server.endpoint_url)
+        repository = AWSEC2Repository(default_region=REGION, client_pool=pool)
+
+        # Warm both paths once so import and loader caches are not counted.
+        client_per_call()
+        repository.list_running_instances()
+
+        before = _measure(args.calls, client_per_call)
+        after = _measure(args.calls, repository.list_running_instances)
+
+    print(f"{args.calls} DescribeInstances calls against {server.endpoint_url}")
+    _report("before: client per call", before)
+    _report("after: pooled client", after)
+    print(f"speedup: {statistics.mean(before) / statistics.mean(after):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Minimal local EC2 Query-API endpoint for benchmarks.
+
+Answers every request with an empty, well-formed response for the requested
+action so botocore parses it like a real one. Only the transport path is
+exercised; see ``fake_ec2`` for a stateful stand-in.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs
+
+_EMPTY_BODIES = {
+    "DescribeInstances": "<reservationSet/>",
+    "DescribeSnapshots": "<snapshotSet/>",
+    "DescribeVolumes": "<volumeSet/>",
+    "DeleteSnapshot": "<return>true</return>",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        params = parse_qs(self.rfile.read(length).decode())
+        action = params.get("Action", ["DescribeInstances"])[0]
+        body = (
+            f'<{action}Response xmlns="http://ec2.amazonaws.com/doc/2016-11-15/">'
+            f"<requestId>stub</requestId>{_EMPTY_BODIES.get(action, '')}"
+            f"</{action}Response>"
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StubEC2Server:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubEC2Server":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -2,6 +2,7 @@ from .use_cases import (
     CreateSnapshotUseCase,
     ListSnapshotsUseCase,
     DeleteSnapshotUseCase,
+    BulkDeleteSnapshotsUseCase,
     ListInstancesUseCase,
     RestoreSnapshotUseCase,
 )
@@ -10,6 +11,7 @@ __all__ = [
     "CreateSnapshotUseCase",
     "ListSnapshotsUseCase",
     "DeleteSnapshotUseCase",
+    "BulkDeleteSnapshotsUseCase",
     "ListInstancesUseCase",
     "RestoreSnapshotUseCase",
 ]
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -9,6 +9,9 @@ class CreateSnapshotRequest:
     instance_name: str
     description: Optional[str] = None
     region: Optional[str] = None
+    all_volumes: bool = False
+    include_root: bool = True
+    devices: Optional[List[str]] = None
 
 
 @dataclass
@@ -16,12 +19,18 @@ class CreateSnapshotResponse:
     snapshot_id: Optional[str]
     success: bool
     message: str
+    snapshot_ids: List[str] = field(default_factory=list)
 
 
 @dataclass
 class ListSnapshotsRequest:
-    instance_id: str
+    instance_id: Optional[str]
     region: Optional[str] = None
+    state: Optional[str] = None
+    volume_id: Optional[str] = None
+    start_after: Optional[datetime] = None
+    start_before: Optional[datetime] = None
+    tags: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -54,6 +63,33 @@ class DeleteSnapshotResponse:
     message: str
 
 
+@dataclass
+class BulkDeleteSnapshotsRequest:
+    snapshot_ids: List[str]
+    region: Optional[str] = None
+    concurrency: int = 8
+
+
+@dataclass
+class SnapshotDeletionResultDTO:
+    snapshot_id: str
+    success: bool
+    attempts: int
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkDeleteSnapshotsResponse:
+    results: List[SnapshotDeletionResultDTO]
+    succeeded: int
+    failed: int
+    throttled: int
+    elapsed_seconds: float
+    throughput: float
+    success: bool
+    message: str
+
+
 @dataclass
 class InstanceDTO:
     instance_id: str
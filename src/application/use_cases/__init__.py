@@ -1,5 +1,8 @@
-from typing import Optional
+from typing import Iterator, Optional
 from ..dtos import (
+    BulkDeleteSnapshotsRequest,
+    BulkDeleteSnapshotsResponse,
+    SnapshotDeletionResultDTO,
     CreateSnapshotRequest,
     CreateSnapshotResponse,
     ListSnapshotsRequest,
@@ -13,7 +16,7 @@ from ..dtos import (
     RestoreSnapshotResponse,
 )
 from ...domain.services import SnapshotService, EC2Service, RestoreService
-from ...domain.entities import SnapshotRequest
+from ...domain.entities import SnapshotFilter, SnapshotRequest
 
 
 class CreateSnapshotUseCase:
@@ -27,8 +30,14 @@ class CreateSnapshotUseCase:
                 instance_name=request.instance_name,
                 description=request.description,
                 region=request.region,
+                all_volumes=request.all_volumes,
+                include_root=request.include_root,
+                devices=request.devices,
             )
 
+            if request.all_volumes:
+                return self._create_multi_volume(snapshot_request)
+
             snapshot_id = self._snapshot_service.create_instance_snapshot(
                 snapshot_request
             )
@@ -38,6 +47,7 @@ class CreateSnapshotUseCase:
                     snapshot_id=snapshot_id,
                     success=True,
                     message=f"Snapshot created successfully: {snapshot_id}",
+                    snapshot_ids=[snapshot_id],
                 )
             else:
                 return CreateSnapshotResponse(
@@ -50,6 +60,28 @@ class CreateSnapshotUseCase:
                 message=f"Error creating snapshot: {str(e)}",
             )
 
+    def _create_multi_volume(
+        self, snapshot_request: SnapshotRequest
+    ) -> CreateSnapshotResponse:
+        snapshot_ids = self._snapshot_service.create_instance_snapshots(
+            snapshot_request
+        )
+
+        if snapshot_ids:
+            return CreateSnapshotResponse(
+                snapshot_id=snapshot_ids[0],
+                success=True,
+                message=(
+                    f"Created {len(snapshot_ids)} snapshots: "
+                    f"{', '.join(snapshot_ids)}"
+                ),
+                snapshot_ids=snapshot_ids,
+            )
+        else:
+            return CreateSnapshotResponse(
+                snapshot_id=None, success=False, message="Failed to create snapshots"
+            )
+
 
 class ListSnapshotsUseCase:
     def __init__(self, snapshot_service: SnapshotService):
@@ -57,22 +89,9 @@ class ListSnapshotsUseCase:
 
     def execute(self, request: ListSnapshotsRequest) -> ListSnapshotsResponse:
         try:
-            snapshots = self._snapshot_service.list_instance_snapshots(
-                request.instance_id, request.region
-            )
-
-            snapshot_dtos = [
-                SnapshotDTO(
-                    snapshot_id=s.snapshot_id,
-                    volume_id=s.volume_id,
-                    description=s.description,
-                    start_time=s.start_time,
-                    state=s.state,
-                    progress=s.progress,
-                    size=s.size,
-                )
-                for s in snapshots
-            ]
+            snapshot_dtos = sorted(
+                self.stream(request), key=lambda s: s.start_time, reverse=True
+            )
 
             return ListSnapshotsResponse(
                 snapshots=snapshot_dtos,
@@ -86,6 +105,27 @@ class ListSnapshotsUseCase:
                 message=f"Error listing snapshots: {str(e)}",
             )
 
+    def stream(self, request: ListSnapshotsRequest) -> Iterator[SnapshotDTO]:
+        snapshot_filter = SnapshotFilter(
+            instance_id=request.instance_id,
+            state=request.state,
+            volume_id=request.volume_id,
+            start_after=request.start_after,
+            start_before=request.start_before,
+            tags=request.tags,
+        )
+
+        for s in self._snapshot_service.iter_snapshots(snapshot_filter, request.region):
+            yield SnapshotDTO(
+                snapshot_id=s.snapshot_id,
+                volume_id=s.volume_id,
+                description=s.description,
+                start_time=s.start_time,
+                state=s.state,
+                progress=s.progress,
+                size=s.size,
+            )
+
 
 class DeleteSnapshotUseCase:
     def __init__(self, snapshot_service: SnapshotService):
@@ -112,23 +152,61 @@ class DeleteSnapshotUseCase:
             )
 
 
+class BulkDeleteSnapshotsUseCase:
+    def __init__(self, snapshot_service: SnapshotService):
+        self._snapshot_service = snapshot_service
+
+    def execute(
+        self, request: BulkDeleteSnapshotsRequest
+    ) -> BulkDeleteSnapshotsResponse:
+        try:
+            report = self._snapshot_service.delete_snapshots(
+                request.snapshot_ids, request.region, request.concurrency
+            )
+
+            result_dtos = [
+                SnapshotDeletionResultDTO(
+                    snapshot_id=r.snapshot_id,
+                    success=r.success,
+                    attempts=r.attempts,
+                    error=r.error,
+                )
+                for r in report.results
+            ]
+
+            return BulkDeleteSnapshotsResponse(
+                results=result_dtos,
+                succeeded=report.succeeded,
+                failed=report.failed,
+                throttled=report.throttled,
+                elapsed_seconds=report.elapsed_seconds,
+                throughput=report.throughput,
+                success=report.failed == 0,
+                message=(
+                    f"Deleted {report.succeeded}/{len(result_dtos)} snapshots in "
+                    f"{report.elapsed_seconds:.1f}s ({report.throughput:.1f}/s)"
+                ),
+            )
+        except Exception as e:
+            return BulkDeleteSnapshotsResponse(
+                results=[],
+                succeeded=0,
+                failed=len(request.snapshot_ids),
+                throttled=0,
+                elapsed_seconds=0.0,
+                throughput=0.0,
+                success=False,
+                message=f"Error deleting snapshots: {str(e)}",
+            )
+
+
 class ListInstancesUseCase:
     def __init__(self, ec2_service: EC2Service):
         self._ec2_service = ec2_service
 
     def execute(self, region: Optional[str] = None) -> ListInstancesResponse:
         try:
-            instances = self._ec2_service.list_running_instances(region)
-
-            instance_dtos = [
-                InstanceDTO(
-                    instance_id=i.instance_id,
-                    name=i.name,
-                    availability_zone=i.availability_zone,
-                    state=i.state,
-                )
-                for i in instances
-            ]
+            instance_dtos = list(self.stream(region))
 
             return ListInstancesResponse(
                 instances=instance_dtos,
@@ -142,6 +220,15 @@ class ListInstancesUseCase:
                 message=f"Error listing instances: {str(e)}",
             )
 
+    def stream(self, region: Optional[str] = None) -> Iterator[InstanceDTO]:
+        for i in self._ec2_service.iter_running_instances(region):
+            yield InstanceDTO(
+                instance_id=i.instance_id,
+                name=i.name,
+                availability_zone=i.availability_zone,
+                state=i.state,
+            )
+
 
 class RestoreSnapshotUseCase:
     def __init__(self, restore_service: RestoreService):
@@ -171,6 +258,7 @@ __all__ = [
     "CreateSnapshotUseCase",
     "ListSnapshotsUseCase",
     "DeleteSnapshotUseCase",
+    "BulkDeleteSnapshotsUseCase",
     "ListInstancesUseCase",
     "RestoreSnapshotUseCase",
 ]
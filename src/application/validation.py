@@ -1,11 +1,13 @@
 from typing import Union, Tuple
 from pydantic import ValidationError
 from ..application.dtos import (
+    BulkDeleteSnapshotsRequest,
     CreateSnapshotRequest,
     DeleteSnapshotRequest,
     RestoreSnapshotRequest,
 )
 from ..infrastructure.config.models import (
+    BulkDeleteSnapshotsRequestModel,
     CreateSnapshotRequestModel,
     DeleteSnapshotRequestModel,
     RestoreSnapshotRequestModel,
@@ -23,6 +25,9 @@ class ValidationService:
                 instance_name=request.instance_name,
                 description=request.description,
                 region=request.region,
+                all_volumes=request.all_volumes,
+                include_root=request.include_root,
+                devices=request.devices,
             )
 
             return True, CreateSnapshotRequest(
@@ -30,6 +35,9 @@ class ValidationService:
                 instance_name=validated_model.instance_name,
                 description=validated_model.description,
                 region=validated_model.region,
+                all_volumes=validated_model.all_volumes,
+                include_root=validated_model.include_root,
+                devices=validated_model.devices,
             )
         except ValidationError as e:
             return False, str(e)
@@ -49,6 +57,25 @@ class ValidationService:
         except ValidationError as e:
             return False, str(e)
 
+    @staticmethod
+    def validate_bulk_delete_snapshots_request(
+        request: BulkDeleteSnapshotsRequest,
+    ) -> Tuple[bool, Union[BulkDeleteSnapshotsRequest, str]]:
+        try:
+            validated_model = BulkDeleteSnapshotsRequestModel(
+                snapshot_ids=request.snapshot_ids,
+                region=request.region,
+                concurrency=request.concurrency,
+            )
+
+            return True, BulkDeleteSnapshotsRequest(
+                snapshot_ids=validated_model.snapshot_ids,
+                region=validated_model.region,
+                concurrency=validated_model.concurrency,
+            )
+        except ValidationError as e:
+            return False, str(e)
+
     @staticmethod
     def validate_restore_snapshot_request(
         request: RestoreSnapshotRequest,
@@ -1,4 +1,4 @@
-from .entities import EC2Instance, EBSVolume, Snapshot, SnapshotRequest
+from .entities import EC2Instance, EBSVolume, Snapshot, SnapshotFilter, SnapshotRequest
 from .services import EC2Service, SnapshotService, RestoreService
 from .value_objects import (
     InstanceId, VolumeId, SnapshotId, VolumeSize, SnapshotDescription,
@@ -7,7 +7,8 @@ from .value_objects import (
 from .exceptions import (
     DomainError, ValidationError, BusinessRuleViolationError,
     InstanceNotFoundError, InstanceNotRunningError, VolumeNotFoundError,
-    SnapshotNotFoundError, SnapshotNotCompletedError, InvalidRegionError
+    SnapshotNotFoundError, SnapshotNotCompletedError, InvalidRegionError,
+    RequestThrottledError
 )
 from .events import (
     DomainEvent, SnapshotCreationRequested, SnapshotCreationCompleted,
@@ -19,6 +20,7 @@ __all__ = [
     "EC2Instance",
     "EBSVolume", 
     "Snapshot",
+    "SnapshotFilter",
     "SnapshotRequest",
     # Domain services
     "EC2Service",
@@ -45,6 +47,7 @@ __all__ = [
     "SnapshotNotFoundError",
     "SnapshotNotCompletedError",
     "InvalidRegionError",
+    "RequestThrottledError",
     # Events
     "DomainEvent",
     "SnapshotCreationRequested",
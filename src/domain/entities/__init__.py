@@ -1,6 +1,6 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -41,12 +41,85 @@ class Snapshot:
         return self.state == "completed"
 
 
+@dataclass(frozen=True)
+class SnapshotFilter:
+    instance_id: Optional[str] = None
+    state: Optional[str] = None
+    volume_id: Optional[str] = None
+    start_after: Optional[datetime] = None
+    start_before: Optional[datetime] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+
+    def matches(self, snapshot: Snapshot) -> bool:
+        if self.instance_id and snapshot.instance_id != self.instance_id:
+            return False
+        if self.state and snapshot.state != self.state:
+            return False
+        if self.volume_id and snapshot.volume_id != self.volume_id:
+            return False
+        return self.matches_start_time(snapshot.start_time)
+
+    def matches_start_time(self, start_time: datetime) -> bool:
+        if self.start_after and start_time < _as_aware(self.start_after, start_time):
+            return False
+        if self.start_before and start_time >= _as_aware(self.start_before, start_time):
+            return False
+        return True
+
+
+def _as_aware(bound: datetime, reference: datetime) -> datetime:
+    # EC2 returns timezone-aware UTC timestamps; naive bounds are taken as UTC.
+    if reference.tzinfo is not None and bound.tzinfo is None:
+        return bound.replace(tzinfo=timezone.utc)
+    return bound
+
+
+@dataclass(frozen=True)
+class SnapshotDeletionResult:
+    snapshot_id: str
+    success: bool
+    attempts: int = 1
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkDeletionReport:
+    results: List[SnapshotDeletionResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    throttled: int = 0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.succeeded / self.elapsed_seconds
+
+
 @dataclass
 class SnapshotRequest:
     instance_id: str
     instance_name: str
     description: Optional[str] = None
     region: Optional[str] = None
+    all_volumes: bool = False
+    include_root: bool = True
+    devices: Optional[List[str]] = None
 
 
-__all__ = ["EC2Instance", "EBSVolume", "Snapshot", "SnapshotRequest"]
+__all__ = [
+    "EC2Instance",
+    "EBSVolume",
+    "Snapshot",
+    "SnapshotFilter",
+    "SnapshotDeletionResult",
+    "BulkDeletionReport",
+    "SnapshotRequest",
+]
@@ -170,6 +170,18 @@ class InsufficientPermissionsError(DomainError):
         self.resource = resource
 
 
+# Throttling related exceptions
+class RequestThrottledError(DomainError):
+    """Raised when AWS rejects a request because the request rate is too high."""
+    
+    def __init__(self, operation: str):
+        super().__init__(
+            f"Request rate exceeded for {operation}",
+            error_code="REQUEST_THROTTLED"
+        )
+        self.operation = operation
+
+
 # Quota related exceptions
 class QuotaExceededError(BusinessRuleViolationError):
     """Raised when AWS quotas are exceeded."""
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from ..entities import EC2Instance, EBSVolume, Snapshot
+from typing import Dict, Iterable, Iterator, List, Optional
+from ..entities import EC2Instance, EBSVolume, Snapshot, SnapshotFilter
 
 
 class EC2Repository(ABC):
@@ -8,6 +8,11 @@ class EC2Repository(ABC):
     def list_running_instances(self, region: Optional[str] = None) -> List[EC2Instance]:
         pass
 
+    def iter_running_instances(
+        self, region: Optional[str] = None
+    ) -> Iterator[EC2Instance]:
+        yield from self.list_running_instances(region)
+
     @abstractmethod
     def get_instance_volumes(
         self, instance_id: str, region: Optional[str] = None
@@ -20,6 +25,11 @@ class EC2Repository(ABC):
     ) -> Optional[EBSVolume]:
         pass
 
+    def get_volumes_for_instances(
+        self, instance_ids: Iterable[str], region: Optional[str] = None
+    ) -> Dict[str, List[EBSVolume]]:
+        return {i: self.get_instance_volumes(i, region) for i in instance_ids}
+
 
 class SnapshotRepository(ABC):
     @abstractmethod
@@ -28,12 +38,33 @@ class SnapshotRepository(ABC):
     ) -> Optional[str]:
         pass
 
+    @abstractmethod
+    def create_snapshots(
+        self,
+        instance_id: str,
+        description: str,
+        tags: dict,
+        exclude_boot_volume: bool = False,
+        exclude_volume_ids: Optional[List[str]] = None,
+        region: Optional[str] = None,
+    ) -> List[str]:
+        pass
+
     @abstractmethod
     def list_snapshots(
         self, instance_id: str, region: Optional[str] = None
     ) -> List[Snapshot]:
         pass
 
+    def iter_snapshots(
+        self, snapshot_filter: SnapshotFilter, region: Optional[str] = None
+    ) -> Iterator[Snapshot]:
+        if not snapshot_filter.instance_id:
+            raise NotImplementedError("Fleet-wide snapshot listing is not supported")
+        for snapshot in self.list_snapshots(snapshot_filter.instance_id, region):
+            if snapshot_filter.matches(snapshot):
+                yield snapshot
+
     @abstractmethod
     def delete_snapshot(self, snapshot_id: str, region: Optional[str] = None) -> bool:
         pass
@@ -1,6 +1,15 @@
-from typing import List, Optional
-from ..entities import EC2Instance, EBSVolume, Snapshot, SnapshotRequest
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..entities import (
+    BulkDeletionReport,
+    EC2Instance,
+    EBSVolume,
+    Snapshot,
+    SnapshotDeletionResult,
+    SnapshotFilter,
+    SnapshotRequest,
+)
 from ..repositories import EC2Repository, SnapshotRepository, VolumeRepository
+from .bulk_delete import AdaptiveBackoff, BulkSnapshotDeleter
 
 
 class EC2Service:
@@ -10,11 +19,21 @@ class EC2Service:
     def list_running_instances(self, region: Optional[str] = None) -> List[EC2Instance]:
         return self._ec2_repo.list_running_instances(region)
 
+    def iter_running_instances(
+        self, region: Optional[str] = None
+    ) -> Iterator[EC2Instance]:
+        return self._ec2_repo.iter_running_instances(region)
+
     def get_instance_volumes(
         self, instance_id: str, region: Optional[str] = None
     ) -> List[EBSVolume]:
         return self._ec2_repo.get_instance_volumes(instance_id, region)
 
+    def get_volumes_for_instances(
+        self, instance_ids: Iterable[str], region: Optional[str] = None
+    ) -> Dict[str, List[EBSVolume]]:
+        return self._ec2_repo.get_volumes_for_instances(instance_ids, region)
+
     def get_root_volume(
         self, instance_id: str, region: Optional[str] = None
     ) -> Optional[EBSVolume]:
@@ -33,23 +52,76 @@ class SnapshotService:
         if not root_volume:
             return None
 
-        description = (
-            request.description or f"Automated snapshot for {request.instance_name}"
-        )
-        tags = {"instance-id": request.instance_id, "Name": request.instance_name}
+        description, tags = self._describe(request)
 
         return self._snapshot_repo.create_snapshot(
             root_volume.volume_id, description, tags, request.region
         )
 
+    def create_instance_snapshots(self, request: SnapshotRequest) -> List[str]:
+        exclude_boot_volume = not request.include_root
+        exclude_volume_ids: List[str] = []
+
+        if request.devices is not None:
+            volumes = self._ec2_repo.get_instance_volumes(
+                request.instance_id, request.region
+            )
+            selected = [
+                v
+                for v in volumes
+                if v.device_name in request.devices
+                and (request.include_root or not v.is_root)
+            ]
+            if not selected:
+                return []
+
+            exclude_boot_volume = not any(v.is_root for v in selected)
+            exclude_volume_ids = [
+                v.volume_id for v in volumes if not v.is_root and v not in selected
+            ]
+
+        description, tags = self._describe(request)
+
+        return self._snapshot_repo.create_snapshots(
+            request.instance_id,
+            description,
+            tags,
+            exclude_boot_volume=exclude_boot_volume,
+            exclude_volume_ids=exclude_volume_ids,
+            region=request.region,
+        )
+
+    @staticmethod
+    def _describe(request: SnapshotRequest) -> Tuple[str, Dict[str, str]]:
+        description = (
+            request.description or f"Automated snapshot for {request.instance_name}"
+        )
+        tags = {"instance-id": request.instance_id, "Name": request.instance_name}
+        return description, tags
+
     def list_instance_snapshots(
         self, instance_id: str, region: Optional[str] = None
     ) -> List[Snapshot]:
         return self._snapshot_repo.list_snapshots(instance_id, region)
 
+    def iter_snapshots(
+        self, snapshot_filter: SnapshotFilter, region: Optional[str] = None
+    ) -> Iterator[Snapshot]:
+        return self._snapshot_repo.iter_snapshots(snapshot_filter, region)
+
     def delete_snapshot(self, snapshot_id: str, region: Optional[str] = None) -> bool:
         return self._snapshot_repo.delete_snapshot(snapshot_id, region)
 
+    def delete_snapshots(
+        self,
+        snapshot_ids: Iterable[str],
+        region: Optional[str] = None,
+        concurrency: int = 8,
+        on_result: Optional[Callable[[SnapshotDeletionResult], None]] = None,
+    ) -> BulkDeletionReport:
+        deleter = BulkSnapshotDeleter(self._snapshot_repo, concurrency=concurrency)
+        return deleter.delete(snapshot_ids, region, on_result)
+
     def get_snapshot(
         self, snapshot_id: str, region: Optional[str] = None
     ) -> Optional[Snapshot]:
@@ -103,4 +175,10 @@ class RestoreService:
         return True
 
 
-__all__ = ["EC2Service", "SnapshotService", "RestoreService"]
+__all__ = [
+    "EC2Service",
+    "SnapshotService",
+    "RestoreService",
+    "AdaptiveBackoff",
+    "BulkSnapshotDeleter",
+]
@@ -0,0 +1,121 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+from ..entities import BulkDeletionReport, SnapshotDeletionResult
+from ..exceptions import RequestThrottledError
+from ..repositories import SnapshotRepository
+
+
+class AdaptiveBackoff:
+    """Delay shared by all workers that grows on throttling and decays on success.
+
+    Every throttled call doubles the delay (up to ``max_delay``) and every
+    successful call halves it, so a worker pool slows down as a whole as
+    soon as any worker hits the request-rate limit.
+    """
+
+    def __init__(self, base_delay: float = 0.1, max_delay: float = 20.0):
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._delay = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    def on_throttle(self) -> float:
+        with self._lock:
+            self._delay = min(self._max_delay, max(self._base_delay, self._delay * 2))
+            return self._delay
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._delay = self._delay / 2 if self._delay > self._base_delay else 0.0
+
+    def wait(self) -> None:
+        delay = self._delay
+        if delay:
+            time.sleep(random.uniform(delay / 2, delay))
+
+
+class BulkSnapshotDeleter:
+    def __init__(
+        self,
+        snapshot_repo: SnapshotRepository,
+        concurrency: int = 8,
+        max_attempts: int = 8,
+        backoff: Optional[AdaptiveBackoff] = None,
+    ):
+        self._snapshot_repo = snapshot_repo
+        self._concurrency = max(1, concurrency)
+        self._max_attempts = max_attempts
+        self._backoff = backoff or AdaptiveBackoff()
+
+    def delete(
+        self,
+        snapshot_ids: Iterable[str],
+        region: Optional[str] = None,
+        on_result: Optional[Callable[[SnapshotDeletionResult], None]] = None,
+    ) -> BulkDeletionReport:
+        report = BulkDeletionReport()
+        pending = iter(snapshot_ids)
+        lock = threading.Lock()
+
+        def worker() -> None:
+            while True:
+                with lock:
+                    snapshot_id = next(pending, None)
+                if snapshot_id is None:
+                    return
+
+                result = self._delete_one(snapshot_id, region, report, lock)
+                with lock:
+                    report.results.append(result)
+                if on_result:
+                    on_result(result)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            workers = [executor.submit(worker) for _ in range(self._concurrency)]
+            for future in workers:
+                future.result()
+        report.elapsed_seconds = time.monotonic() - started
+
+        return report
+
+    def _delete_one(
+        self,
+        snapshot_id: str,
+        region: Optional[str],
+        report: BulkDeletionReport,
+        lock: threading.Lock,
+    ) -> SnapshotDeletionResult:
+        attempts = 0
+        while True:
+            attempts += 1
+            self._backoff.wait()
+            try:
+                deleted = self._snapshot_repo.delete_snapshot(snapshot_id, region)
+            except RequestThrottledError as e:
+                with lock:
+                    report.throttled += 1
+                self._backoff.on_throttle()
+                if attempts >= self._max_attempts:
+                    return SnapshotDeletionResult(snapshot_id, False, attempts, str(e))
+                continue
+            except Exception as e:
+                return SnapshotDeletionResult(snapshot_id, False, attempts, str(e))
+
+            self._backoff.on_success()
+            if deleted:
+                return SnapshotDeletionResult(snapshot_id, True, attempts)
+            return SnapshotDeletionResult(
+                snapshot_id, False, attempts, "Failed to delete snapshot"
+            )
+
+
+__all__ = ["AdaptiveBackoff", "BulkSnapshotDeleter"]
@@ -5,10 +5,13 @@ from ..application.use_cases import (
     CreateSnapshotUseCase,
     ListSnapshotsUseCase,
     DeleteSnapshotUseCase,
+    BulkDeleteSnapshotsUseCase,
     ListInstancesUseCase,
     RestoreSnapshotUseCase,
 )
 from ..infrastructure.aws import (
+    AWSClientPool,
+    AdaptiveRateLimiter,
     AWSEC2Repository,
     AWSSnapshotRepository,
     AWSVolumeRepository,
@@ -24,16 +27,43 @@ class Container(containers.DeclarativeContainer):
         Logger, level=config.provided.log_level, log_file=config.provided.log_file
     )
 
+    client_pool = providers.Singleton(
+        AWSClientPool,
+        profile=config.provided.aws.profile,
+        max_pool_connections=config.provided.aws.max_pool_connections,
+        tcp_keepalive=config.provided.aws.tcp_keepalive,
+    )
+
+    rate_limiter = providers.Singleton(
+        AdaptiveRateLimiter,
+        describe_rate=config.provided.aws.describe_rate,
+        mutate_rate=config.provided.aws.mutate_rate,
+        max_retries=config.provided.aws.throttle_retries,
+        enabled=config.provided.aws.rate_limit_enabled,
+    )
+
     ec2_repository = providers.Singleton(
-        AWSEC2Repository, default_region=config.provided.aws.region
+        AWSEC2Repository,
+        default_region=config.provided.aws.region,
+        client_pool=client_pool,
+        page_size=config.provided.aws.page_size,
+        rate_limiter=rate_limiter,
     )
 
     snapshot_repository = providers.Singleton(
-        AWSSnapshotRepository, default_region=config.provided.aws.region
+        AWSSnapshotRepository,
+        default_region=config.provided.aws.region,
+        client_pool=client_pool,
+        page_size=config.provided.aws.page_size,
+        rate_limiter=rate_limiter,
     )
 
     volume_repository = providers.Singleton(
-        AWSVolumeRepository, default_region=config.provided.aws.region
+        AWSVolumeRepository,
+        default_region=config.provided.aws.region,
+        client_pool=client_pool,
+        page_size=config.provided.aws.page_size,
+        rate_limiter=rate_limiter,
     )
 
     ec2_service = providers.Singleton(EC2Service, ec2_repo=ec2_repository)
@@ -61,6 +91,10 @@ class Container(containers.DeclarativeContainer):
         DeleteSnapshotUseCase, snapshot_service=snapshot_service
     )
 
+    bulk_delete_snapshots_use_case = providers.Singleton(
+        BulkDeleteSnapshotsUseCase, snapshot_service=snapshot_service
+    )
+
     list_instances_use_case = providers.Singleton(
         ListInstancesUseCase, ec2_service=ec2_service
     )
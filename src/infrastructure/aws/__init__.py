@@ -1,85 +1,204 @@
-import boto3
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 from botocore.exceptions import ClientError
 
-from ...domain.entities import EC2Instance, EBSVolume, Snapshot
+from ...domain.entities import EC2Instance, EBSVolume, Snapshot, SnapshotFilter
 from ...domain.repositories import EC2Repository, SnapshotRepository, VolumeRepository
+from .client_pool import AWSClientPool
+from .rate_limiter import AdaptiveRateLimiter
 
+# EC2 accepts at most 200 values per filter and 500 results per
+# describe_volumes page.
+FILTER_VALUES_LIMIT = 200
+DESCRIBE_VOLUMES_MAX_RESULTS = 500
 
-class AWSEC2Repository(EC2Repository):
-    def __init__(self, default_region: Optional[str] = None):
+
+def _chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class AWSRepositoryBase:
+    def __init__(
+        self,
+        default_region: Optional[str] = None,
+        client_pool: Optional[AWSClientPool] = None,
+        page_size: int = 1000,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
         self._default_region = default_region
+        self._client_pool = client_pool or AWSClientPool()
+        self._page_size = page_size
+        self._rate_limiter = rate_limiter or AdaptiveRateLimiter()
 
     def _get_client(self, region: Optional[str] = None):
-        return boto3.client("ec2", region_name=region or self._default_region)
+        return self._client_pool.get_client("ec2", region or self._default_region)
 
-    def list_running_instances(self, region: Optional[str] = None) -> List[EC2Instance]:
+    def _call(self, operation: str, region: Optional[str] = None, **kwargs: Any):
+        region = region or self._default_region
         client = self._get_client(region)
-        instances = []
+        return self._rate_limiter.call(
+            region, operation, getattr(client, operation), **kwargs
+        )
+
+    def _paginate(
+        self,
+        operation: str,
+        region: Optional[str] = None,
+        page_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        # Pages are fetched with explicit NextToken calls rather than a boto3
+        # paginator so that every page goes through the rate limiter and a
+        # throttled page is retried without restarting the whole sweep.
+        kwargs["MaxResults"] = page_size or self._page_size
+        while True:
+            page = self._call(operation, region, **kwargs)
+            yield page
+            next_token = page.get("NextToken")
+            if not isinstance(next_token, str) or not next_token:
+                return
+            kwargs["NextToken"] = next_token
+
+
+class AWSEC2Repository(AWSRepositoryBase, EC2Repository):
+    def list_running_instances(self, region: Optional[str] = None) -> List[EC2Instance]:
+        return list(self.iter_running_instances(region))
 
+    def iter_running_instances(
+        self, region: Optional[str] = None
+    ) -> Iterator[EC2Instance]:
         try:
-            response = client.describe_instances(
-                Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
+            pages = self._paginate(
+                "describe_instances",
+                region,
+                Filters=[{"Name": "instance-state-name", "Values": ["running"]}],
             )
 
-            for reservation in response["Reservations"]:
-                for instance in reservation["Instances"]:
-                    name = next(
-                        (
-                            tag["Value"]
-                            for tag in instance.get("Tags", [])
-                            if tag["Key"] == "Name"
-                        ),
-                        "No Name",
-                    )
-
-                    instances.append(
-                        EC2Instance(
-                            instance_id=instance["InstanceId"],
-                            name=name,
-                            availability_zone=instance["Placement"]["AvailabilityZone"],
-                            state=instance["State"]["Name"],
-                        )
-                    )
+            for page in pages:
+                for reservation in page["Reservations"]:
+                    for instance in reservation["Instances"]:
+                        yield self._to_instance(instance)
         except ClientError:
-            pass
-
-        return instances
+            return
+
+    @staticmethod
+    def _to_instance(instance: Dict[str, Any]) -> EC2Instance:
+        name = next(
+            (tag["Value"] for tag in instance.get("Tags", []) if tag["Key"] == "Name"),
+            "No Name",
+        )
+
+        return EC2Instance(
+            instance_id=instance["InstanceId"],
+            name=name,
+            availability_zone=instance["Placement"]["AvailabilityZone"],
+            state=instance["State"]["Name"],
+        )
 
     def get_instance_volumes(
         self, instance_id: str, region: Optional[str] = None
     ) -> List[EBSVolume]:
-        client = self._get_client(region)
         volumes = []
 
         try:
-            response = client.describe_instances(InstanceIds=[instance_id])
+            response = self._call(
+                "describe_instances", region, InstanceIds=[instance_id]
+            )
             instance = response["Reservations"][0]["Instances"][0]
             root_device_name = instance.get("RootDeviceName", "/dev/sda1")
 
-            for mapping in instance.get("BlockDeviceMappings", []):
-                if "Ebs" in mapping:
-                    volume_response = client.describe_volumes(
-                        VolumeIds=[mapping["Ebs"]["VolumeId"]]
-                    )
-                    volume_info = volume_response["Volumes"][0]
-
-                    volumes.append(
-                        EBSVolume(
-                            volume_id=mapping["Ebs"]["VolumeId"],
-                            device_name=mapping["DeviceName"],
-                            instance_id=instance_id,
-                            size=volume_info["Size"],
-                            volume_type=volume_info["VolumeType"],
-                            is_root=(mapping["DeviceName"] == root_device_name),
-                        )
+            mappings = [
+                m for m in instance.get("BlockDeviceMappings", []) if "Ebs" in m
+            ]
+            if not mappings:
+                return volumes
+
+            volume_response = self._call(
+                "describe_volumes",
+                region,
+                VolumeIds=[m["Ebs"]["VolumeId"] for m in mappings],
+            )
+            volume_infos = {v["VolumeId"]: v for v in volume_response["Volumes"]}
+
+            for mapping in mappings:
+                volume_info = volume_infos.get(mapping["Ebs"]["VolumeId"])
+                if volume_info is None:
+                    continue
+
+                volumes.append(
+                    EBSVolume(
+                        volume_id=mapping["Ebs"]["VolumeId"],
+                        device_name=mapping["DeviceName"],
+                        instance_id=instance_id,
+                        size=volume_info["Size"],
+                        volume_type=volume_info["VolumeType"],
+                        is_root=(mapping["DeviceName"] == root_device_name),
                     )
+                )
         except (ClientError, KeyError, IndexError):
             pass
 
         return volumes
 
+    def get_volumes_for_instances(
+        self, instance_ids: Iterable[str], region: Optional[str] = None
+    ) -> Dict[str, List[EBSVolume]]:
+        instance_ids = list(dict.fromkeys(instance_ids))
+        volumes: Dict[str, List[EBSVolume]] = {i: [] for i in instance_ids}
+
+        try:
+            for chunk in _chunked(instance_ids, FILTER_VALUES_LIMIT):
+                root_devices = self._get_root_device_names(chunk, region)
+                pages = self._paginate(
+                    "describe_volumes",
+                    region,
+                    page_size=min(self._page_size, DESCRIBE_VOLUMES_MAX_RESULTS),
+                    Filters=[{"Name": "attachment.instance-id", "Values": chunk}],
+                )
+
+                for page in pages:
+                    for volume_info in page["Volumes"]:
+                        for attachment in volume_info.get("Attachments", []):
+                            instance_id = attachment["InstanceId"]
+                            if instance_id not in volumes:
+                                continue
+
+                            volumes[instance_id].append(
+                                EBSVolume(
+                                    volume_id=volume_info["VolumeId"],
+                                    device_name=attachment["Device"],
+                                    instance_id=instance_id,
+                                    size=volume_info["Size"],
+                                    volume_type=volume_info["VolumeType"],
+                                    is_root=(
+                                        attachment["Device"]
+                                        == root_devices.get(instance_id, "/dev/sda1")
+                                    ),
+                                )
+                            )
+        except ClientError:
+            pass
+
+        return volumes
+
+    def _get_root_device_names(
+        self, instance_ids: List[str], region: Optional[str]
+    ) -> Dict[str, str]:
+        # A filter rather than InstanceIds, so one unknown id does not fail
+        # the whole chunk with InvalidInstanceID.NotFound.
+        pages = self._paginate(
+            "describe_instances",
+            region,
+            Filters=[{"Name": "instance-id", "Values": instance_ids}],
+        )
+        return {
+            instance["InstanceId"]: instance.get("RootDeviceName", "/dev/sda1")
+            for page in pages
+            for reservation in page["Reservations"]
+            for instance in reservation["Instances"]
+        }
+
     def get_root_volume(
         self, instance_id: str, region: Optional[str] = None
     ) -> Optional[EBSVolume]:
@@ -88,18 +207,10 @@ class AWSEC2Repository(EC2Repository):
         return root_volumes[0] if root_volumes else (volumes[0] if volumes else None)
 
 
-class AWSSnapshotRepository(SnapshotRepository):
-    def __init__(self, default_region: Optional[str] = None):
-        self._default_region = default_region
-
-    def _get_client(self, region: Optional[str] = None):
-        return boto3.client("ec2", region_name=region or self._default_region)
-
+class AWSSnapshotRepository(AWSRepositoryBase, SnapshotRepository):
     def create_snapshot(
         self, volume_id: str, description: str, tags: dict, region: Optional[str] = None
     ) -> Optional[str]:
-        client = self._get_client(region)
-
         try:
             tag_specifications = [
                 {
@@ -108,7 +219,9 @@ class AWSSnapshotRepository(SnapshotRepository):
                 }
             ]
 
-            response = client.create_snapshot(
+            response = self._call(
+                "create_snapshot",
+                region,
                 VolumeId=volume_id,
                 Description=description,
                 TagSpecifications=tag_specifications,
@@ -118,43 +231,114 @@ class AWSSnapshotRepository(SnapshotRepository):
         except ClientError:
             return None
 
+    def create_snapshots(
+        self,
+        instance_id: str,
+        description: str,
+        tags: dict,
+        exclude_boot_volume: bool = False,
+        exclude_volume_ids: Optional[List[str]] = None,
+        region: Optional[str] = None,
+    ) -> List[str]:
+        try:
+            instance_specification: Dict[str, Any] = {
+                "InstanceId": instance_id,
+                "ExcludeBootVolume": exclude_boot_volume,
+            }
+            if exclude_volume_ids:
+                instance_specification["ExcludeDataVolumeIds"] = exclude_volume_ids
+
+            response = self._call(
+                "create_snapshots",
+                region,
+                InstanceSpecification=instance_specification,
+                Description=description,
+                TagSpecifications=[
+                    {
+                        "ResourceType": "snapshot",
+                        "Tags": [{"Key": k, "Value": v} for k, v in tags.items()],
+                    }
+                ],
+            )
+
+            return [s["SnapshotId"] for s in response["Snapshots"]]
+        except ClientError:
+            return []
+
     def list_snapshots(
         self, instance_id: str, region: Optional[str] = None
     ) -> List[Snapshot]:
-        client = self._get_client(region)
-        snapshots = []
+        snapshots = list(
+            self.iter_snapshots(SnapshotFilter(instance_id=instance_id), region)
+        )
+        snapshots.sort(key=lambda s: s.start_time, reverse=True)
+        return snapshots
 
+    def iter_snapshots(
+        self, snapshot_filter: SnapshotFilter, region: Optional[str] = None
+    ) -> Iterator[Snapshot]:
         try:
-            response = client.describe_snapshots(
-                Filters=[{"Name": "tag:instance-id", "Values": [instance_id]}],
+            pages = self._paginate(
+                "describe_snapshots",
+                region,
+                Filters=self._build_filters(snapshot_filter),
                 OwnerIds=["self"],
             )
 
-            for snapshot_data in response["Snapshots"]:
-                snapshots.append(
-                    Snapshot(
-                        snapshot_id=snapshot_data["SnapshotId"],
-                        volume_id=snapshot_data["VolumeId"],
-                        instance_id=instance_id,
-                        description=snapshot_data["Description"],
-                        start_time=snapshot_data["StartTime"],
-                        state=snapshot_data["State"],
-                        progress=snapshot_data.get("Progress", ""),
-                        size=snapshot_data["VolumeSize"],
-                    )
-                )
-
-            snapshots.sort(key=lambda s: s.start_time, reverse=True)
+            for page in pages:
+                for snapshot_data in page["Snapshots"]:
+                    # describe_snapshots has no range filter for StartTime, so
+                    # the date bounds are the only part checked client-side.
+                    if snapshot_filter.matches_start_time(snapshot_data["StartTime"]):
+                        yield self._to_snapshot(
+                            snapshot_data, snapshot_filter.instance_id
+                        )
         except ClientError:
-            pass
+            return
+
+    @staticmethod
+    def _build_filters(snapshot_filter: SnapshotFilter) -> List[Dict[str, Any]]:
+        filters = []
+        if snapshot_filter.instance_id:
+            filters.append(
+                {"Name": "tag:instance-id", "Values": [snapshot_filter.instance_id]}
+            )
+        if snapshot_filter.state:
+            filters.append({"Name": "status", "Values": [snapshot_filter.state]})
+        if snapshot_filter.volume_id:
+            filters.append({"Name": "volume-id", "Values": [snapshot_filter.volume_id]})
+        for key, value in snapshot_filter.tags.items():
+            filters.append({"Name": f"tag:{key}", "Values": [value]})
+        return filters
+
+    @staticmethod
+    def _to_snapshot(
+        snapshot_data: Dict[str, Any], instance_id: Optional[str] = None
+    ) -> Snapshot:
+        if instance_id is None:
+            instance_id = next(
+                (
+                    tag["Value"]
+                    for tag in snapshot_data.get("Tags", [])
+                    if tag["Key"] == "instance-id"
+                ),
+                "",
+            )
 
-        return snapshots
+        return Snapshot(
+            snapshot_id=snapshot_data["SnapshotId"],
+            volume_id=snapshot_data["VolumeId"],
+            instance_id=instance_id,
+            description=snapshot_data["Description"],
+            start_time=snapshot_data["StartTime"],
+            state=snapshot_data["State"],
+            progress=snapshot_data.get("Progress", ""),
+            size=snapshot_data["VolumeSize"],
+        )
 
     def delete_snapshot(self, snapshot_id: str, region: Optional[str] = None) -> bool:
-        client = self._get_client(region)
-
         try:
-            client.delete_snapshot(SnapshotId=snapshot_id)
+            self._call("delete_snapshot", region, SnapshotId=snapshot_id)
             return True
         except ClientError:
             return False
@@ -162,50 +346,25 @@ class AWSSnapshotRepository(SnapshotRepository):
     def get_snapshot(
         self, snapshot_id: str, region: Optional[str] = None
     ) -> Optional[Snapshot]:
-        client = self._get_client(region)
-
         try:
-            response = client.describe_snapshots(SnapshotIds=[snapshot_id])
-            snapshot_data = response["Snapshots"][0]
-
-            instance_id = next(
-                (
-                    tag["Value"]
-                    for tag in snapshot_data.get("Tags", [])
-                    if tag["Key"] == "instance-id"
-                ),
-                "",
-            )
-
-            return Snapshot(
-                snapshot_id=snapshot_data["SnapshotId"],
-                volume_id=snapshot_data["VolumeId"],
-                instance_id=instance_id,
-                description=snapshot_data["Description"],
-                start_time=snapshot_data["StartTime"],
-                state=snapshot_data["State"],
-                progress=snapshot_data.get("Progress", ""),
-                size=snapshot_data["VolumeSize"],
+            response = self._call(
+                "describe_snapshots", region, SnapshotIds=[snapshot_id]
             )
+            return self._to_snapshot(response["Snapshots"][0])
         except (ClientError, KeyError, IndexError):
             return None
 
 
-class AWSVolumeRepository(VolumeRepository):
-    def __init__(self, default_region: Optional[str] = None):
-        self._default_region = default_region
-
-    def _get_client(self, region: Optional[str] = None):
-        return boto3.client("ec2", region_name=region or self._default_region)
-
+class AWSVolumeRepository(AWSRepositoryBase, VolumeRepository):
     def create_volume_from_snapshot(
         self, snapshot_id: str, availability_zone: str, region: Optional[str] = None
     ) -> Optional[str]:
-        client = self._get_client(region)
-
         try:
-            response = client.create_volume(
-                SnapshotId=snapshot_id, AvailabilityZone=availability_zone
+            response = self._call(
+                "create_volume",
+                region,
+                SnapshotId=snapshot_id,
+                AvailabilityZone=availability_zone,
             )
             return response["VolumeId"]
         except ClientError:
@@ -218,21 +377,31 @@ class AWSVolumeRepository(VolumeRepository):
         device: str,
         region: Optional[str] = None,
     ) -> bool:
-        client = self._get_client(region)
-
         try:
-            client.attach_volume(
-                VolumeId=volume_id, InstanceId=instance_id, Device=device
+            self._call(
+                "attach_volume",
+                region,
+                VolumeId=volume_id,
+                InstanceId=instance_id,
+                Device=device,
             )
             return True
         except ClientError:
             return False
 
     def detach_volume(self, volume_id: str, region: Optional[str] = None) -> bool:
-        client = self._get_client(region)
-
         try:
-            client.detach_volume(VolumeId=volume_id)
+            self._call("detach_volume", region, VolumeId=volume_id)
             return True
         except ClientError:
             return False
+
+
+__all__ = [
+    "AWSClientPool",
+    "AdaptiveRateLimiter",
+    "AWSRepositoryBase",
+    "AWSEC2Repository",
+    "AWSSnapshotRepository",
+    "AWSVolumeRepository",
+]
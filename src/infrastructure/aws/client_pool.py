@@ -0,0 +1,72 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+
+class AWSClientPool:
+    """Process-wide cache of boto3 clients keyed by (profile, region, service).
+
+    boto3 clients are thread-safe once built, but building one resolves
+    credentials and endpoints and owns its own urllib3 connection pool.
+    Sharing a client per key lets every repository call reuse warm,
+    kept-alive HTTPS connections instead of paying that cost per call.
+    """
+
+    def __init__(
+        self,
+        profile: Optional[str] = None,
+        max_pool_connections: int = 50,
+        tcp_keepalive: bool = True,
+        endpoint_url: Optional[str] = None,
+    ):
+        self._profile = profile
+        self._endpoint_url = endpoint_url
+        self._config = Config(
+            max_pool_connections=max_pool_connections, tcp_keepalive=tcp_keepalive
+        )
+        self._sessions: Dict[str, boto3.session.Session] = {}
+        self._clients: Dict[Tuple[Optional[str], Optional[str], str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        service: str,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+    ) -> Any:
+        profile = profile or self._profile
+        key = (profile, region, service)
+
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._create_client(service, region, profile)
+                    self._clients[key] = client
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+
+    def _create_client(
+        self, service: str, region: Optional[str], profile: Optional[str]
+    ) -> Any:
+        kwargs: Dict[str, Any] = {"region_name": region, "config": self._config}
+        if self._endpoint_url:
+            kwargs["endpoint_url"] = self._endpoint_url
+
+        if profile is None:
+            return boto3.client(service, **kwargs)
+
+        # boto3 sessions are not thread-safe, so they are only touched while
+        # holding the pool lock; the clients they produce are.
+        session = self._sessions.get(profile)
+        if session is None:
+            session = boto3.session.Session(profile_name=profile)
+            self._sessions[profile] = session
+        return session.client(service, **kwargs)
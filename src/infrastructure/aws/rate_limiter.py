@@ -0,0 +1,167 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from botocore.exceptions import ClientError
+
+from ...domain.exceptions import RequestThrottledError
+
+T = TypeVar("T")
+
+THROTTLING_ERROR_CODES = frozenset(
+    {"RequestLimitExceeded", "Throttling", "ThrottlingException"}
+)
+
+DESCRIBE = "describe"
+MUTATE = "mutate"
+
+
+def is_throttling_error(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+
+
+def action_class(operation: str) -> str:
+    """Map a boto3 operation name onto the EC2 request-rate bucket it draws from."""
+    return DESCRIBE if operation.startswith(("describe_", "get_")) else MUTATE
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate follows AIMD.
+
+    A throttling response halves the rate and empties the bucket; every
+    successful call adds back a fixed fraction of the configured rate until
+    it is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float = 0.5,
+        increase_ratio: float = 0.05,
+    ):
+        self._max_rate = rate
+        self._rate = rate
+        self._min_rate = min(min_rate, rate)
+        self._increase = rate * increase_ratio
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._rate < self._max_rate:
+                self._rate = min(self._max_rate, self._rate + self._increase)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+
+class AdaptiveRateLimiter:
+    """Client-side limiter shared by every repository, one bucket per
+    (region, action class).
+
+    Defaults follow EC2's documented request-rate buckets: non-mutating
+    (describe) actions refill at 20/s with a burst of 100, mutating actions
+    at 5/s with a burst of 50. Throttled calls are retried up to
+    ``max_retries`` times before RequestThrottledError is raised.
+    """
+
+    def __init__(
+        self,
+        describe_rate: float = 20.0,
+        describe_burst: float = 100.0,
+        mutate_rate: float = 5.0,
+        mutate_burst: float = 50.0,
+        max_retries: int = 3,
+        enabled: bool = True,
+    ):
+        self._limits = {
+            DESCRIBE: (describe_rate, describe_burst),
+            MUTATE: (mutate_rate, mutate_burst),
+        }
+        self._max_retries = max_retries
+        self._enabled = enabled
+        self._buckets: Dict[Tuple[Optional[str], str], AdaptiveTokenBucket] = {}
+        self._throttle_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def throttle_count(self) -> int:
+        return self._throttle_count
+
+    def current_rate(self, region: Optional[str], operation_class: str) -> float:
+        return self._bucket(region, operation_class).rate
+
+    def rates(self) -> Dict[Tuple[Optional[str], str], float]:
+        with self._lock:
+            return {key: bucket.rate for key, bucket in self._buckets.items()}
+
+    def call(
+        self,
+        region: Optional[str],
+        operation: str,
+        fn: Callable[..., T],
+        **kwargs: Any,
+    ) -> T:
+        if not self._enabled:
+            return fn(**kwargs)
+
+        bucket = self._bucket(region, action_class(operation))
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                result = fn(**kwargs)
+            except ClientError as e:
+                if not is_throttling_error(e):
+                    raise
+                bucket.on_throttle()
+                with self._lock:
+                    self._throttle_count += 1
+                if attempt >= self._max_retries:
+                    raise RequestThrottledError(operation) from e
+                attempt += 1
+                continue
+
+            bucket.on_success()
+            return result
+
+    def _bucket(
+        self, region: Optional[str], operation_class: str
+    ) -> AdaptiveTokenBucket:
+        key = (region, operation_class)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self._limits[operation_class]
+                    bucket = AdaptiveTokenBucket(rate, burst)
+                    self._buckets[key] = bucket
+        return bucket
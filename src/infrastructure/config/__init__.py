@@ -11,14 +11,43 @@ load_dotenv()
 class AWSConfig:
     region: Optional[str] = None
     profile: Optional[str] = None
+    max_pool_connections: int = 50
+    tcp_keepalive: bool = True
+    page_size: int = 1000
+    rate_limit_enabled: bool = True
+    describe_rate: float = 20.0
+    mutate_rate: float = 5.0
+    throttle_retries: int = 3
 
     @classmethod
     def from_env(cls) -> "AWSConfig":
-        return cls(region=os.getenv("AWS_REGION"), profile=os.getenv("AWS_PROFILE"))
+        return cls(
+            region=os.getenv("AWS_REGION"),
+            profile=os.getenv("AWS_PROFILE"),
+            max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50")),
+            tcp_keepalive=os.getenv("AWS_TCP_KEEPALIVE", "true").lower() == "true",
+            page_size=int(os.getenv("AWS_PAGE_SIZE", "1000")),
+            rate_limit_enabled=(
+                os.getenv("AWS_RATE_LIMIT_ENABLED", "true").lower() == "true"
+            ),
+            describe_rate=float(os.getenv("AWS_DESCRIBE_RATE", "20")),
+            mutate_rate=float(os.getenv("AWS_MUTATE_RATE", "5")),
+            throttle_retries=int(os.getenv("AWS_THROTTLE_RETRIES", "3")),
+        )
 
     @classmethod
     def from_pydantic(cls, model: AWSConfigModel) -> "AWSConfig":
-        return cls(region=model.region, profile=model.profile)
+        return cls(
+            region=model.region,
+            profile=model.profile,
+            max_pool_connections=model.max_pool_connections,
+            tcp_keepalive=model.tcp_keepalive,
+            page_size=model.page_size,
+            rate_limit_enabled=model.rate_limit_enabled,
+            describe_rate=model.describe_rate,
+            mutate_rate=model.mutate_rate,
+            throttle_retries=model.throttle_retries,
+        )
 
 
 @dataclass
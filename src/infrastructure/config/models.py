@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -6,6 +6,23 @@ from pydantic_settings import BaseSettings
 class AWSConfigModel(BaseModel):
     region: Optional[str] = Field(None, description="AWS Region")
     profile: Optional[str] = Field(None, description="AWS Profile")
+    max_pool_connections: int = Field(
+        50, ge=1, description="HTTP connections kept per pooled boto3 client"
+    )
+    tcp_keepalive: bool = Field(True, description="Enable TCP keep-alive")
+    page_size: int = Field(
+        1000, ge=5, le=1000, description="Items requested per describe_* page"
+    )
+    rate_limit_enabled: bool = Field(True, description="Client-side rate limiting")
+    describe_rate: float = Field(
+        20.0, gt=0, description="Sustained describe_* calls per second per region"
+    )
+    mutate_rate: float = Field(
+        5.0, gt=0, description="Sustained mutating calls per second per region"
+    )
+    throttle_retries: int = Field(
+        3, ge=0, description="Retries of a throttled call before giving up"
+    )
 
     @field_validator("region")
     @classmethod
@@ -22,12 +39,39 @@ class AppSettings(BaseSettings):
 
     aws_region: Optional[str] = Field(None, json_schema_extra={"env": "AWS_REGION"})
     aws_profile: Optional[str] = Field(None, json_schema_extra={"env": "AWS_PROFILE"})
+    aws_max_pool_connections: int = Field(
+        50, json_schema_extra={"env": "AWS_MAX_POOL_CONNECTIONS"}
+    )
+    aws_tcp_keepalive: bool = Field(
+        True, json_schema_extra={"env": "AWS_TCP_KEEPALIVE"}
+    )
+    aws_page_size: int = Field(1000, json_schema_extra={"env": "AWS_PAGE_SIZE"})
+    aws_rate_limit_enabled: bool = Field(
+        True, json_schema_extra={"env": "AWS_RATE_LIMIT_ENABLED"}
+    )
+    aws_describe_rate: float = Field(
+        20.0, json_schema_extra={"env": "AWS_DESCRIBE_RATE"}
+    )
+    aws_mutate_rate: float = Field(5.0, json_schema_extra={"env": "AWS_MUTATE_RATE"})
+    aws_throttle_retries: int = Field(
+        3, json_schema_extra={"env": "AWS_THROTTLE_RETRIES"}
+    )
     log_level: str = Field("INFO", json_schema_extra={"env": "LOG_LEVEL"})
     log_file: str = Field("backup.log", json_schema_extra={"env": "LOG_FILE"})
 
     @property
     def aws_config(self) -> AWSConfigModel:
-        return AWSConfigModel(region=self.aws_region, profile=self.aws_profile)
+        return AWSConfigModel(
+            region=self.aws_region,
+            profile=self.aws_profile,
+            max_pool_connections=self.aws_max_pool_connections,
+            tcp_keepalive=self.aws_tcp_keepalive,
+            page_size=self.aws_page_size,
+            rate_limit_enabled=self.aws_rate_limit_enabled,
+            describe_rate=self.aws_describe_rate,
+            mutate_rate=self.aws_mutate_rate,
+            throttle_retries=self.aws_throttle_retries,
+        )
 
 
 class CreateSnapshotRequestModel(BaseModel):
@@ -37,6 +81,11 @@ class CreateSnapshotRequestModel(BaseModel):
         None, max_length=255, description="Snapshot Description"
     )
     region: Optional[str] = Field(None, description="AWS Region")
+    all_volumes: bool = Field(False, description="Snapshot every attached volume")
+    include_root: bool = Field(True, description="Include the root volume")
+    devices: Optional[List[str]] = Field(
+        None, description="Only snapshot volumes attached at these devices"
+    )
 
     @field_validator("instance_id")
     @classmethod
@@ -58,6 +107,20 @@ class DeleteSnapshotRequestModel(BaseModel):
         return v
 
 
+class BulkDeleteSnapshotsRequestModel(BaseModel):
+    snapshot_ids: List[str] = Field(..., min_length=1, description="Snapshot IDs")
+    region: Optional[str] = Field(None, description="AWS Region")
+    concurrency: int = Field(8, ge=1, le=64, description="Parallel deletions")
+
+    @field_validator("snapshot_ids")
+    @classmethod
+    def validate_snapshot_ids(cls, v):
+        invalid = [s for s in v if not s.startswith("snap-")]
+        if invalid:
+            raise ValueError(f'Snapshot IDs must start with "snap-": {invalid[:5]}')
+        return v
+
+
 class RestoreSnapshotRequestModel(BaseModel):
     instance_id: str = Field(..., min_length=10, description="EC2 Instance ID")
     snapshot_id: str = Field(..., min_length=12, description="Snapshot ID")
@@ -1,5 +1,5 @@
 from typing import List
-from ...application.dtos import ListInstancesResponse
+from ...application.dtos import InstanceDTO
 from ...infrastructure import Container
 from ...infrastructure.logging import logger
 from .menu import MenuService
@@ -14,22 +14,25 @@ class CLIApplication:
 
     def run(self) -> None:
         try:
-            instances_response = self._container.list_instances_use_case().execute()
+            instances = []
+            for instance in self._container.list_instances_use_case().stream():
+                instances.append(instance)
+                logger.debug(f"Found {instance.name} ({instance.instance_id})")
 
-            if not instances_response.success or not instances_response.instances:
+            if not instances:
                 logger.error("No running EC2 instances found.")
                 return
 
-            self._run_main_loop(instances_response)
+            self._run_main_loop(instances)
 
         except Exception as e:
             logger.error(f"Application error: {str(e)}")
 
-    def _run_main_loop(self, instances_response: ListInstancesResponse) -> None:
+    def _run_main_loop(self, instances: List[InstanceDTO]) -> None:
         choice = self._menu_service.show_main_menu()
         command = self._command_factory.create_command(choice)
 
         if command:
-            command.execute(instances_response.instances)
+            command.execute(instances)
         else:
             logger.warning("Invalid option selected.")
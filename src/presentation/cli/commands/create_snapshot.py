@@ -30,11 +30,15 @@ class CreateSnapshotCommand(BaseCommand):
                 description = click.prompt(
                     "Enter description (optional)", default="", show_default=False
                 )
+                all_volumes = click.confirm(
+                    "Snapshot all attached volumes together?", default=False
+                )
 
                 request = CreateSnapshotRequest(
                     instance_id=selected_instance.instance_id,
                     instance_name=selected_instance.name,
                     description=description if description else None,
+                    all_volumes=all_volumes,
                 )
 
                 is_valid, validated_request_or_error = (
@@ -1,6 +1,9 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
-from src.domain.entities import EC2Instance, EBSVolume, Snapshot
+from botocore.exceptions import ClientError
+from src.domain.entities import EC2Instance, EBSVolume, Snapshot, SnapshotFilter
+from src.domain.exceptions import RequestThrottledError
 from src.domain.repositories import EC2Repository, SnapshotRepository, VolumeRepository
 from src.infrastructure.aws import AWSEC2Repository, AWSSnapshotRepository, AWSVolumeRepository
 
@@ -14,20 +17,22 @@ class TestAWSEC2Repository:
         mock_client = Mock()
         mock_boto_client.return_value = mock_client
 
-        mock_client.describe_instances.return_value = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-1234567890abcdef0",
-                            "State": {"Name": "running"},
-                            "Placement": {"AvailabilityZone": "us-east-1a"},
-                            "Tags": [{"Key": "Name", "Value": "test-instance"}],
-                        }
-                    ]
-                }
-            ]
-        }
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {
+                                "InstanceId": "i-1234567890abcdef0",
+                                "State": {"Name": "running"},
+                                "Placement": {"AvailabilityZone": "us-east-1a"},
+                                "Tags": [{"Key": "Name", "Value": "test-instance"}],
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
 
         instances = self.repository.list_running_instances()
 
@@ -42,26 +47,62 @@ class TestAWSEC2Repository:
         mock_client = Mock()
         mock_boto_client.return_value = mock_client
 
-        mock_client.describe_instances.return_value = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-1234567890abcdef0",
-                            "State": {"Name": "running"},
-                            "Placement": {"AvailabilityZone": "us-east-1a"},
-                            "Tags": [],
-                        }
-                    ]
-                }
-            ]
-        }
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {
+                                "InstanceId": "i-1234567890abcdef0",
+                                "State": {"Name": "running"},
+                                "Placement": {"AvailabilityZone": "us-east-1a"},
+                                "Tags": [],
+                            }
+                        ]
+                    }
+                ]
+            }
+        ]
 
         instances = self.repository.list_running_instances()
 
         assert len(instances) == 1
         assert instances[0].name == "No Name"
 
+    @patch("boto3.client")
+    def test_iter_running_instances_reads_every_page(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+        repository = AWSEC2Repository(default_region="us-east-1", page_size=5)
+
+        def page(*instance_ids):
+            return {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {
+                                "InstanceId": instance_id,
+                                "State": {"Name": "running"},
+                                "Placement": {"AvailabilityZone": "us-east-1a"},
+                            }
+                            for instance_id in instance_ids
+                        ]
+                    }
+                ]
+            }
+
+        mock_client.get_paginator.return_value.paginate.return_value = iter(
+            [page("i-1", "i-2"), page("i-3")]
+        )
+
+        instances = repository.iter_running_instances()
+
+        assert next(instances).instance_id == "i-1"
+        assert [i.instance_id for i in instances] == ["i-2", "i-3"]
+        mock_client.get_paginator.assert_called_once_with("describe_instances")
+        paginate_kwargs = mock_client.get_paginator.return_value.paginate.call_args
+        assert paginate_kwargs.kwargs["PaginationConfig"] == {"PageSize": 5}
+
     @patch("boto3.client")
     def test_get_root_volume_success(self, mock_boto_client):
         mock_client = Mock()
@@ -86,7 +127,9 @@ class TestAWSEC2Repository:
         }
 
         mock_client.describe_volumes.return_value = {
-            "Volumes": [{"Size": 8, "VolumeType": "gp3"}]
+            "Volumes": [
+                {"VolumeId": "vol-1234567890abcdef0", "Size": 8, "VolumeType": "gp3"}
+            ]
         }
 
         volume = self.repository.get_root_volume("i-1234567890abcdef0")
@@ -95,6 +138,97 @@ class TestAWSEC2Repository:
         assert volume.volume_id == "vol-1234567890abcdef0"
         assert volume.is_root is True
 
+    @patch("boto3.client")
+    def test_get_instance_volumes_single_describe_volumes(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+
+        mock_client.describe_instances.return_value = {
+            "Reservations": [
+                {
+                    "Instances": [
+                        {
+                            "RootDeviceName": "/dev/xvda",
+                            "BlockDeviceMappings": [
+                                {"DeviceName": "/dev/xvda", "Ebs": {"VolumeId": "vol-a"}},
+                                {"DeviceName": "/dev/xvdb", "Ebs": {"VolumeId": "vol-b"}},
+                            ],
+                        }
+                    ]
+                }
+            ]
+        }
+        mock_client.describe_volumes.return_value = {
+            "Volumes": [
+                {"VolumeId": "vol-b", "Size": 100, "VolumeType": "st1"},
+                {"VolumeId": "vol-a", "Size": 8, "VolumeType": "gp3"},
+            ]
+        }
+
+        volumes = self.repository.get_instance_volumes("i-1234567890abcdef0")
+
+        assert [(v.volume_id, v.size, v.is_root) for v in volumes] == [
+            ("vol-a", 8, True),
+            ("vol-b", 100, False),
+        ]
+        mock_client.describe_volumes.assert_called_once_with(
+            VolumeIds=["vol-a", "vol-b"]
+        )
+
+    @patch("boto3.client")
+    def test_get_volumes_for_instances_chunks_filter_values(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+        instance_ids = [f"i-{n:017x}" for n in range(250)]
+        paginators = {"describe_instances": Mock(), "describe_volumes": Mock()}
+        mock_client.get_paginator.side_effect = lambda name: paginators[name]
+
+        def describe_instances(Filters, **kwargs):
+            return [
+                {
+                    "Reservations": [
+                        {
+                            "Instances": [
+                                {"InstanceId": i, "RootDeviceName": "/dev/xvda"}
+                                for i in Filters[0]["Values"]
+                            ]
+                        }
+                    ]
+                }
+            ]
+
+        def describe_volumes(Filters, **kwargs):
+            return [
+                {
+                    "Volumes": [
+                        {
+                            "VolumeId": f"vol-{i[2:]}",
+                            "Size": 8,
+                            "VolumeType": "gp3",
+                            "Attachments": [{"InstanceId": i, "Device": "/dev/xvda"}],
+                        }
+                        for i in Filters[0]["Values"]
+                    ]
+                }
+            ]
+
+        paginators["describe_instances"].paginate.side_effect = describe_instances
+        paginators["describe_volumes"].paginate.side_effect = describe_volumes
+
+        volumes = self.repository.get_volumes_for_instances(instance_ids)
+
+        assert len(volumes) == 250
+        assert all(len(v) == 1 and v[0].is_root for v in volumes.values())
+        chunk_sizes = [
+            len(call.kwargs["Filters"][0]["Values"])
+            for call in paginators["describe_volumes"].paginate.call_args_list
+        ]
+        assert chunk_sizes == [200, 50]
+        page_size = paginators["describe_volumes"].paginate.call_args.kwargs[
+            "PaginationConfig"
+        ]["PageSize"]
+        assert page_size == 500
+
 
 class TestAWSSnapshotRepository:
     def setup_method(self):
@@ -118,6 +252,38 @@ class TestAWSSnapshotRepository:
         assert snapshot_id == "snap-1234567890abcdef0"
         mock_client.create_snapshot.assert_called_once()
 
+    @patch("boto3.client")
+    def test_create_snapshots_uses_instance_specification(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+
+        mock_client.create_snapshots.return_value = {
+            "Snapshots": [
+                {"SnapshotId": "snap-1", "VolumeId": "vol-1"},
+                {"SnapshotId": "snap-2", "VolumeId": "vol-2"},
+            ]
+        }
+
+        snapshot_ids = self.repository.create_snapshots(
+            "i-1234567890abcdef0",
+            "test description",
+            {"instance-id": "i-1234567890abcdef0", "Name": "test-instance"},
+            exclude_boot_volume=True,
+            exclude_volume_ids=["vol-3"],
+        )
+
+        assert snapshot_ids == ["snap-1", "snap-2"]
+        kwargs = mock_client.create_snapshots.call_args.kwargs
+        assert kwargs["InstanceSpecification"] == {
+            "InstanceId": "i-1234567890abcdef0",
+            "ExcludeBootVolume": True,
+            "ExcludeDataVolumeIds": ["vol-3"],
+        }
+        assert kwargs["TagSpecifications"][0]["Tags"] == [
+            {"Key": "instance-id", "Value": "i-1234567890abcdef0"},
+            {"Key": "Name", "Value": "test-instance"},
+        ]
+
     @patch("boto3.client")
     def test_delete_snapshot_success(self, mock_boto_client):
         mock_client = Mock()
@@ -130,6 +296,72 @@ class TestAWSSnapshotRepository:
             SnapshotId="snap-1234567890abcdef0"
         )
 
+    @patch("boto3.client")
+    def test_iter_snapshots_pushes_filters_to_api(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+
+        def snapshot(snapshot_id, day):
+            return {
+                "SnapshotId": snapshot_id,
+                "VolumeId": "vol-1234567890abcdef0",
+                "Description": "daily",
+                "StartTime": datetime(2024, 1, day, tzinfo=timezone.utc),
+                "State": "completed",
+                "VolumeSize": 8,
+                "Tags": [{"Key": "instance-id", "Value": "i-1234567890abcdef0"}],
+            }
+
+        mock_client.get_paginator.return_value.paginate.return_value = iter(
+            [
+                {"Snapshots": [snapshot("snap-1", 1), snapshot("snap-2", 2)]},
+                {"Snapshots": [snapshot("snap-3", 3)]},
+            ]
+        )
+
+        snapshots = list(
+            self.repository.iter_snapshots(
+                SnapshotFilter(
+                    state="completed",
+                    volume_id="vol-1234567890abcdef0",
+                    start_after=datetime(2024, 1, 2),
+                    tags={"env": "prod"},
+                )
+            )
+        )
+
+        assert [s.snapshot_id for s in snapshots] == ["snap-2", "snap-3"]
+        assert snapshots[0].instance_id == "i-1234567890abcdef0"
+        mock_client.get_paginator.assert_called_once_with("describe_snapshots")
+        paginate_kwargs = mock_client.get_paginator.return_value.paginate.call_args
+        assert paginate_kwargs.kwargs["OwnerIds"] == ["self"]
+        assert paginate_kwargs.kwargs["Filters"] == [
+            {"Name": "status", "Values": ["completed"]},
+            {"Name": "volume-id", "Values": ["vol-1234567890abcdef0"]},
+            {"Name": "tag:env", "Values": ["prod"]},
+        ]
+
+    @patch("boto3.client")
+    def test_delete_snapshot_throttled_raises(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+        mock_client.delete_snapshot.side_effect = ClientError(
+            {"Error": {"Code": "RequestLimitExceeded"}}, "DeleteSnapshot"
+        )
+
+        with pytest.raises(RequestThrottledError):
+            self.repository.delete_snapshot("snap-1234567890abcdef0")
+
+    @patch("boto3.client")
+    def test_delete_snapshot_other_error_returns_false(self, mock_boto_client):
+        mock_client = Mock()
+        mock_boto_client.return_value = mock_client
+        mock_client.delete_snapshot.side_effect = ClientError(
+            {"Error": {"Code": "InvalidSnapshot.InUse"}}, "DeleteSnapshot"
+        )
+
+        assert self.repository.delete_snapshot("snap-1234567890abcdef0") is False
+
 
 class TestAWSVolumeRepository:
     def setup_method(self):
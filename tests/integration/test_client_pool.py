@@ -0,0 +1,73 @@
+import threading
+from unittest.mock import Mock, patch
+from src.infrastructure.aws import (
+    AWSClientPool,
+    AWSEC2Repository,
+    AWSSnapshotRepository,
+)
+
+
+class TestAWSClientPool:
+    @patch("boto3.client")
+    def test_client_reused_per_region(self, mock_boto_client):
+        mock_boto_client.side_effect = lambda *args, **kwargs: Mock()
+        pool = AWSClientPool()
+
+        first = pool.get_client("ec2", "us-east-1")
+        second = pool.get_client("ec2", "us-east-1")
+        other_region = pool.get_client("ec2", "eu-west-1")
+
+        assert first is second
+        assert first is not other_region
+        assert mock_boto_client.call_count == 2
+
+    @patch("boto3.client")
+    def test_client_config_applied(self, mock_boto_client):
+        pool = AWSClientPool(max_pool_connections=128, tcp_keepalive=False)
+
+        pool.get_client("ec2", "us-east-1")
+
+        config = mock_boto_client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 128
+        assert config.tcp_keepalive is False
+
+    @patch("boto3.session.Session")
+    def test_profile_uses_named_session(self, mock_session_cls):
+        pool = AWSClientPool(profile="ops")
+
+        pool.get_client("ec2", "us-east-1")
+        pool.get_client("ec2", "us-west-2")
+
+        mock_session_cls.assert_called_once_with(profile_name="ops")
+        assert mock_session_cls.return_value.client.call_count == 2
+
+    @patch("boto3.client")
+    def test_concurrent_first_use_builds_one_client(self, mock_boto_client):
+        mock_boto_client.side_effect = lambda *args, **kwargs: Mock()
+        pool = AWSClientPool()
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(pool.get_client("ec2", "us-east-1"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_boto_client.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    @patch("boto3.client")
+    def test_repositories_share_pool(self, mock_boto_client):
+        pool = AWSClientPool()
+        ec2_repository = AWSEC2Repository("us-east-1", client_pool=pool)
+        snapshot_repository = AWSSnapshotRepository("us-east-1", client_pool=pool)
+
+        ec2_repository.list_running_instances()
+        snapshot_repository.delete_snapshot("snap-1234567890abcdef0")
+
+        mock_boto_client.assert_called_once()
@@ -1,6 +1,12 @@
 import pytest
-from datetime import datetime
-from src.domain.entities import EC2Instance, EBSVolume, Snapshot, SnapshotRequest
+from datetime import datetime, timezone
+from src.domain.entities import (
+    EC2Instance,
+    EBSVolume,
+    Snapshot,
+    SnapshotFilter,
+    SnapshotRequest,
+)
 
 
 class TestEC2Instance:
@@ -132,3 +138,42 @@ class TestSnapshotRequest:
         assert request.instance_name == "test-instance"
         assert request.description is None
         assert request.region is None
+
+
+class TestSnapshotFilter:
+    def _snapshot(self, start_time, state="completed"):
+        return Snapshot(
+            snapshot_id="snap-1234567890abcdef0",
+            volume_id="vol-1234567890abcdef0",
+            instance_id="i-1234567890abcdef0",
+            description="test snapshot",
+            start_time=start_time,
+            state=state,
+            progress="100%",
+            size=8,
+        )
+
+    def test_empty_filter_matches_everything(self):
+        assert SnapshotFilter().matches(self._snapshot(datetime.now()))
+
+    def test_state_and_volume_filters(self):
+        snapshot = self._snapshot(datetime.now(), state="pending")
+
+        assert not SnapshotFilter(state="completed").matches(snapshot)
+        assert SnapshotFilter(volume_id="vol-1234567890abcdef0").matches(snapshot)
+        assert not SnapshotFilter(volume_id="vol-other").matches(snapshot)
+
+    def test_date_range_is_half_open(self):
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 2, 1)
+        date_filter = SnapshotFilter(start_after=start, start_before=end)
+
+        assert date_filter.matches(self._snapshot(start))
+        assert not date_filter.matches(self._snapshot(end))
+
+    def test_naive_bounds_compare_against_aware_start_time(self):
+        aware = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        assert SnapshotFilter(start_after=datetime(2024, 1, 1)).matches(
+            self._snapshot(aware)
+        )
@@ -2,7 +2,13 @@ import pytest
 from unittest.mock import Mock
 from src.domain.entities import EC2Instance, SnapshotRequest
 from src.domain.repositories import EC2Repository, SnapshotRepository
-from src.domain.services import EC2Service, SnapshotService
+from src.domain.exceptions import RequestThrottledError
+from src.domain.services import (
+    AdaptiveBackoff,
+    BulkSnapshotDeleter,
+    EC2Service,
+    SnapshotService,
+)
 
 
 class TestEC2Service:
@@ -76,3 +82,123 @@ class TestSnapshotService:
         self.mock_snapshot_repo.delete_snapshot.assert_called_once_with(
             "snap-123", "us-east-1"
         )
+
+    def test_create_instance_snapshots_all_volumes(self):
+        self.mock_snapshot_repo.create_snapshots.return_value = ["snap-1", "snap-2"]
+
+        request = SnapshotRequest("i-123", "test-instance", all_volumes=True)
+        result = self.service.create_instance_snapshots(request)
+
+        assert result == ["snap-1", "snap-2"]
+        self.mock_ec2_repo.get_instance_volumes.assert_not_called()
+        self.mock_snapshot_repo.create_snapshots.assert_called_once_with(
+            "i-123",
+            "Automated snapshot for test-instance",
+            {"instance-id": "i-123", "Name": "test-instance"},
+            exclude_boot_volume=False,
+            exclude_volume_ids=[],
+            region=None,
+        )
+
+    def test_create_instance_snapshots_device_filter(self):
+        from src.domain.entities import EBSVolume
+
+        self.mock_ec2_repo.get_instance_volumes.return_value = [
+            EBSVolume("vol-root", "/dev/xvda", "i-123", 8, "gp3", True),
+            EBSVolume("vol-data", "/dev/xvdb", "i-123", 100, "gp3"),
+            EBSVolume("vol-logs", "/dev/xvdc", "i-123", 50, "gp3"),
+        ]
+        self.mock_snapshot_repo.create_snapshots.return_value = ["snap-1"]
+
+        request = SnapshotRequest(
+            "i-123", "test-instance", all_volumes=True, devices=["/dev/xvdb"]
+        )
+        self.service.create_instance_snapshots(request)
+
+        kwargs = self.mock_snapshot_repo.create_snapshots.call_args.kwargs
+        assert kwargs["exclude_boot_volume"] is True
+        assert kwargs["exclude_volume_ids"] == ["vol-logs"]
+
+    def test_create_instance_snapshots_nothing_selected(self):
+        self.mock_ec2_repo.get_instance_volumes.return_value = []
+
+        request = SnapshotRequest(
+            "i-123", "test-instance", all_volumes=True, devices=["/dev/xvdz"]
+        )
+
+        assert self.service.create_instance_snapshots(request) == []
+        self.mock_snapshot_repo.create_snapshots.assert_not_called()
+
+
+class TestBulkSnapshotDeleter:
+    def setup_method(self):
+        self.mock_snapshot_repo = Mock(spec=SnapshotRepository)
+        self.backoff = AdaptiveBackoff(base_delay=0.001, max_delay=0.01)
+
+    def test_deletes_every_id(self):
+        self.mock_snapshot_repo.delete_snapshot.side_effect = (
+            lambda snapshot_id, region: snapshot_id != "snap-bad"
+        )
+        deleter = BulkSnapshotDeleter(
+            self.mock_snapshot_repo, concurrency=4, backoff=self.backoff
+        )
+
+        report = deleter.delete(
+            [f"snap-{n}" for n in range(20)] + ["snap-bad"], "us-east-1"
+        )
+
+        assert len(report.results) == 21
+        assert report.succeeded == 20
+        assert report.failed == 1
+        assert report.throughput > 0
+        failed = [r for r in report.results if not r.success]
+        assert failed[0].snapshot_id == "snap-bad"
+
+    def test_retries_throttled_requests(self):
+        calls = {"count": 0}
+
+        def delete_snapshot(snapshot_id, region):
+            calls["count"] += 1
+            if calls["count"] <= 2:
+                raise RequestThrottledError("DeleteSnapshot")
+            return True
+
+        self.mock_snapshot_repo.delete_snapshot.side_effect = delete_snapshot
+        deleter = BulkSnapshotDeleter(
+            self.mock_snapshot_repo, concurrency=1, backoff=self.backoff
+        )
+
+        report = deleter.delete(["snap-1"])
+
+        assert report.throttled == 2
+        assert report.results[0].success is True
+        assert report.results[0].attempts == 3
+
+    def test_gives_up_after_max_attempts(self):
+        self.mock_snapshot_repo.delete_snapshot.side_effect = RequestThrottledError(
+            "DeleteSnapshot"
+        )
+        deleter = BulkSnapshotDeleter(
+            self.mock_snapshot_repo, concurrency=1, max_attempts=3, backoff=self.backoff
+        )
+
+        report = deleter.delete(["snap-1"])
+
+        assert report.results[0].success is False
+        assert report.results[0].attempts == 3
+        assert "Request rate exceeded" in report.results[0].error
+
+
+class TestAdaptiveBackoff:
+    def test_grows_on_throttle_and_decays_on_success(self):
+        backoff = AdaptiveBackoff(base_delay=0.1, max_delay=0.3)
+
+        assert backoff.on_throttle() == 0.1
+        assert backoff.on_throttle() == 0.2
+        assert backoff.on_throttle() == 0.3
+
+        backoff.on_success()
+        assert backoff.delay == 0.15
+        backoff.on_success()
+        backoff.on_success()
+        assert backoff.delay == 0.0
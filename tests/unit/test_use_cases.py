@@ -1,8 +1,26 @@
 import pytest
+from datetime import datetime
 from unittest.mock import Mock
-from src.application.dtos import CreateSnapshotRequest, CreateSnapshotResponse
-from src.domain.services import SnapshotService
-from src.application.use_cases import CreateSnapshotUseCase
+from src.application.dtos import (
+    BulkDeleteSnapshotsRequest,
+    CreateSnapshotRequest,
+    CreateSnapshotResponse,
+    ListSnapshotsRequest,
+)
+from src.domain.entities import (
+    BulkDeletionReport,
+    EC2Instance,
+    Snapshot,
+    SnapshotDeletionResult,
+    SnapshotFilter,
+)
+from src.domain.services import SnapshotService, EC2Service
+from src.application.use_cases import (
+    BulkDeleteSnapshotsUseCase,
+    CreateSnapshotUseCase,
+    ListInstancesUseCase,
+    ListSnapshotsUseCase,
+)
 
 
 @pytest.mark.unit
@@ -53,3 +71,138 @@ class TestCreateSnapshotUseCase:
         assert response.success is False
         assert response.snapshot_id is None
         assert "Error creating snapshot" in response.message
+
+    def test_execute_all_volumes(self):
+        self.mock_snapshot_service.create_instance_snapshots.return_value = [
+            "snap-1",
+            "snap-2",
+        ]
+
+        request = CreateSnapshotRequest(
+            instance_id="i-123",
+            instance_name="test-instance",
+            all_volumes=True,
+            include_root=False,
+        )
+
+        response = self.use_case.execute(request)
+
+        assert response.success is True
+        assert response.snapshot_ids == ["snap-1", "snap-2"]
+        self.mock_snapshot_service.create_instance_snapshot.assert_not_called()
+        snapshot_request = (
+            self.mock_snapshot_service.create_instance_snapshots.call_args.args[0]
+        )
+        assert snapshot_request.include_root is False
+
+
+@pytest.mark.unit
+class TestListInstancesUseCase:
+    def setup_method(self):
+        self.mock_ec2_service = Mock(spec=EC2Service)
+        self.use_case = ListInstancesUseCase(self.mock_ec2_service)
+
+    def test_stream_yields_dtos_lazily(self):
+        def instances():
+            yield EC2Instance("i-123", "web", "us-east-1a", "running")
+            raise AssertionError("stream consumed past the first instance")
+
+        self.mock_ec2_service.iter_running_instances.return_value = instances()
+
+        stream = self.use_case.stream("us-east-1")
+
+        assert next(stream).instance_id == "i-123"
+        self.mock_ec2_service.iter_running_instances.assert_called_once_with(
+            "us-east-1"
+        )
+
+    def test_execute_collects_stream(self):
+        self.mock_ec2_service.iter_running_instances.return_value = iter(
+            [
+                EC2Instance("i-123", "web", "us-east-1a", "running"),
+                EC2Instance("i-456", "db", "us-east-1b", "running"),
+            ]
+        )
+
+        response = self.use_case.execute()
+
+        assert response.success is True
+        assert [i.instance_id for i in response.instances] == ["i-123", "i-456"]
+
+
+@pytest.mark.unit
+class TestListSnapshotsUseCase:
+    def setup_method(self):
+        self.mock_snapshot_service = Mock(spec=SnapshotService)
+        self.use_case = ListSnapshotsUseCase(self.mock_snapshot_service)
+
+    def _snapshot(self, snapshot_id, day):
+        return Snapshot(
+            snapshot_id,
+            "vol-123",
+            "i-123",
+            "daily",
+            datetime(2024, 1, day),
+            "completed",
+            "100%",
+            8,
+        )
+
+    def test_request_filters_forwarded_to_service(self):
+        self.mock_snapshot_service.iter_snapshots.return_value = iter([])
+        request = ListSnapshotsRequest(
+            instance_id="i-123",
+            region="us-east-1",
+            state="completed",
+            tags={"env": "prod"},
+        )
+
+        list(self.use_case.stream(request))
+
+        self.mock_snapshot_service.iter_snapshots.assert_called_once_with(
+            SnapshotFilter(
+                instance_id="i-123", state="completed", tags={"env": "prod"}
+            ),
+            "us-east-1",
+        )
+
+    def test_execute_sorts_newest_first(self):
+        self.mock_snapshot_service.iter_snapshots.return_value = iter(
+            [self._snapshot("snap-1", 1), self._snapshot("snap-3", 3)]
+        )
+
+        response = self.use_case.execute(ListSnapshotsRequest(instance_id="i-123"))
+
+        assert response.success is True
+        assert [s.snapshot_id for s in response.snapshots] == ["snap-3", "snap-1"]
+
+
+@pytest.mark.unit
+class TestBulkDeleteSnapshotsUseCase:
+    def setup_method(self):
+        self.mock_snapshot_service = Mock(spec=SnapshotService)
+        self.use_case = BulkDeleteSnapshotsUseCase(self.mock_snapshot_service)
+
+    def test_execute_reports_per_id_results(self):
+        self.mock_snapshot_service.delete_snapshots.return_value = BulkDeletionReport(
+            results=[
+                SnapshotDeletionResult("snap-1", True),
+                SnapshotDeletionResult("snap-2", False, 3, "Request rate exceeded"),
+            ],
+            elapsed_seconds=2.0,
+            throttled=2,
+        )
+
+        response = self.use_case.execute(
+            BulkDeleteSnapshotsRequest(["snap-1", "snap-2"], concurrency=4)
+        )
+
+        assert response.success is False
+        assert response.succeeded == 1
+        assert response.failed == 1
+        assert response.throttled == 2
+        assert response.throughput == 0.5
+        assert response.results[1].attempts == 3
+        self.mock_snapshot_service.delete_snapshots.assert_called_once_with(
+            ["snap-1", "snap-2"], None, 4
+        )